@@ -0,0 +1,3 @@
+#!/usr/bin/env python
+# This file was created automatically
+longversion = '2021.03.09-08-53-08'
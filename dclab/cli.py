@@ -408,8 +408,8 @@ def skip_empty_image_events(ds, initial=True, final=True):
     if initial:
         if (("image" in ds and ds.format == "tdms"
              and ds.config["fmt_tdms"]["video frame offset"])
-            or ("contour" in ds and np.all(ds["contour"][0] == 0))
-                or ("image" in ds and np.all(ds["image"][0] == 0))):
+            or ("contour" in ds and not np.any(ds["contour"][0]))
+                or ("image" in ds and not np.any(ds["image"][0]))):
             ds.filter.manual[0] = False
             ds.apply_filter()
     if final:
@@ -426,7 +426,7 @@ def skip_empty_image_events(ds, initial=True, final=True):
                     if wfin:
                         ds.filter.manual[idfin] = False
                         ds.apply_filter()
-            elif np.all(ds["image"][idfin] == 0):
+            elif not np.any(ds["image"][idfin]):
                 ds.filter.manual[idfin] = False
                 ds.apply_filter()
 
@@ -1,13 +1,38 @@
 """RT-DC dataset configuration"""
 
 import copy
+import functools
+import locale
 import pathlib
+import re
 import sys
 import warnings
 
 from .. import definitions as dfn
 
 
+#: Hard-coded default values of the "filtering" configuration section
+DEFAULT_FILTERING = {
+    # Do not filter out invalid event values
+    "remove invalid events": False,
+    # Enable filters switch is mandatory
+    "enable filters": True,
+    # Limit events integer to downsample output data
+    "limit events": 0,
+    # Polygon filter list
+    "polygon filters": [],
+    # Defaults to no hierarchy parent
+    "hierarchy parent": "none",
+}
+
+
+#: Regular expression for lines in configuration files; matches
+#: either a section "[section]" or a "key = value" pair (comments
+#: starting with "#" are ignored)
+_RE_CFG_LINE = re.compile(r"^\s*(?:\[([^#]*)\]|([^=#]*?)\s*=([^#]*?))"
+                          r"\s*(?:#.*)?$")
+
+
 class UnknownConfigurationKeyWarning(UserWarning):
     pass
 
@@ -22,62 +47,61 @@ class ConfigurationDict(dict):
         :func:`verify_section_key`.
         """
         self.section = section
-        super(ConfigurationDict, self).__init__(*args, **kwargs)
-        self._convert_keys()
+        super(ConfigurationDict, self).__init__()
+        self.update(*args, **kwargs)
 
     def __getitem__(self, key):
-        return super(ConfigurationDict,
-                     self).__getitem__(self.__class__._k(key))
+        if isinstance(key, str):
+            key = key.lower()
+        return dict.__getitem__(self, key)
 
     def __setitem__(self, key, value):
-        key = self.__class__._k(key)
-        if self.section:
-            valid = verify_section_key(self.section, key)
-        else:
-            valid = True
-        if valid:
+        if isinstance(key, str):
+            key = key.lower()
+        if self.section is None or verify_section_key(self.section, key):
             # only set valid keys
-            super(ConfigurationDict, self).__setitem__(key, value)
+            dict.__setitem__(self, key, value)
 
     def __delitem__(self, key):
-        return super(ConfigurationDict,
-                     self).__delitem__(self.__class__._k(key))
+        if isinstance(key, str):
+            key = key.lower()
+        dict.__delitem__(self, key)
 
     def __contains__(self, key):
-        return super(ConfigurationDict,
-                     self).__contains__(self.__class__._k(key))
-
-    @classmethod
-    def _k(cls, key):
-        """Convert a key to lower case"""
-        return key.lower() if isinstance(key, str) else key
-
-    def _convert_keys(self):
-        for k in list(self.keys()):
-            v = super(ConfigurationDict, self).pop(k)
-            self.__setitem__(k, v)
-
-    def get(self, key, *args, **kwargs):
-        return super(ConfigurationDict,
-                     self).get(self.__class__._k(key), *args, **kwargs)
-
-    def items(self):
-        keys = list(self.keys())
-        keys.sort()
-        out = [(k, self[k]) for k in keys]
-        return out
-
-    def pop(self, key, *args, **kwargs):
-        return super(ConfigurationDict,
-                     self).pop(self.__class__._k(key), *args, **kwargs)
-
-    def setdefault(self, key, *args, **kwargs):
-        return super(ConfigurationDict,
-                     self).setdefault(self.__class__._k(key), *args, **kwargs)
-
-    def update(self, E={}, **F):
-        for key in E:
-            self.__setitem__(key, E[key])
+        if isinstance(key, str):
+            key = key.lower()
+        return dict.__contains__(self, key)
+
+    def get(self, key, *args):
+        if isinstance(key, str):
+            key = key.lower()
+        return dict.get(self, key, *args)
+
+    def pop(self, key, *args):
+        if isinstance(key, str):
+            key = key.lower()
+        return dict.pop(self, key, *args)
+
+    def setdefault(self, key, default=None):
+        if isinstance(key, str):
+            key = key.lower()
+        if not dict.__contains__(self, key):
+            # go through `__setitem__` for section verification
+            self.__setitem__(key, default)
+        return dict.get(self, key)
+
+    def update(self, E=(), **F):
+        if (isinstance(E, ConfigurationDict)
+                and (self.section is None or self.section == E.section)):
+            # keys are already lower-case (and verified for this section)
+            dict.update(self, E)
+        else:
+            if hasattr(E, "keys"):
+                pairs = ((key, E[key]) for key in E.keys())
+            else:
+                pairs = E
+            for key, value in pairs:
+                self.__setitem__(key, value)
         for key in F:
             self.__setitem__(key, F[key])
 
@@ -158,25 +182,12 @@ class Configuration(object):
         """Set default initial values
 
         The default values are hard-coded for backwards compatibility
-        and for several functionalities in dclab.
+        and for several functionalities in dclab (see
+        :const:`DEFAULT_FILTERING`).
         """
-        # Do not filter out invalid event values
-        self["filtering"]["remove invalid events"] = False
-        # Enable filters switch is mandatory
-        self["filtering"]["enable filters"] = True
-        # Limit events integer to downsample output data
-        self["filtering"]["limit events"] = 0
-        # Polygon filter list
-        self["filtering"]["polygon filters"] = []
-        # Defaults to no hierarchy parent
-        self["filtering"]["hierarchy parent"] = "none"
-
-        # Make sure that all filtering values have a default value
-        # (otherwise we will get problems with resetting filters)
-        for item in dfn.CFG_ANALYSIS["filtering"]:
-            if item[0] not in self["filtering"]:
-                raise KeyError(
-                    "No default value set for [filtering]:{}".format(item[0]))
+        # The keys in DEFAULT_FILTERING are lower-case and valid, so
+        # we may bypass `ConfigurationDict.__setitem__`.
+        dict.update(self["filtering"], copy.deepcopy(DEFAULT_FILTERING))
 
     def copy(self):
         """Return copy of current configuration"""
@@ -201,7 +212,9 @@ class Configuration(object):
         """Save the configuration to a file"""
         filename = pathlib.Path(filename)
         out_str = self.tostring()
-        with filename.open("w") as f:
+        # always UTF-8 (`load_from_file` tries UTF-8 first), but keep
+        # the platform-specific line endings
+        with filename.open("w", encoding="utf-8") as f:
             f.write(out_str)
 
     def tostring(self, sections=None):
@@ -215,24 +228,17 @@ class Configuration(object):
         """
         out = []
         if sections is None:
-            keys = sorted(list(self.keys()))
+            keys = sorted(self.keys())
         else:
             keys = sorted([k for k in sections if k in self.keys()])
         for key in keys:
-            out.append("[{}]".format(key))
+            out.append("[{}]\n".format(key))
             section = self[key]
-            ikeys = list(section.keys())
-            ikeys.sort()
-            for ikey in ikeys:
+            for ikey in sorted(section.keys()):
                 var, val = keyval_typ2str(ikey, section[ikey])
-                out.append("{} = {}".format(var, val))
-            out.append("")
-
-        out_str = ""
-        for i in range(len(out)):
-            # win-like line endings
-            out_str += out[i]+"\n"
-        return out_str
+                out.append("{} = {}\n".format(var, val))
+            out.append("\n")
+        return "".join(out)
 
     def update(self, newcfg):
         """Update current config with a dictionary"""
@@ -310,40 +316,46 @@ def load_from_file(cfg_file):
         Dictionary with configuration parameters
     """
     path = pathlib.Path(cfg_file).resolve()
-    with path.open("r", errors="replace") as f:
-        code = f.readlines()
+    # read the file in one go and split it in memory
+    raw = path.read_bytes()
+    try:
+        text = raw.decode("utf-8")
+    except UnicodeDecodeError:
+        # files not written by dclab>=0.33.1 (e.g. cp1252 on Windows)
+        text = raw.decode(locale.getpreferredencoding(False),
+                          errors="replace")
+    code = text.splitlines()
 
     cfg = ConfigurationDict()
     for line in code:
         # We deal with comments and empty lines
-        # We need to check line length first and then we look for
-        # a hash.
-        line = line.split("#")[0].strip()
-        if len(line) != 0:
-            if line.startswith("[") and line.endswith("]"):
-                sec = line[1:-1].lower()
-                if sec not in cfg:
-                    cfg[sec] = ConfigurationDict()
-                continue
-            elif not line.count("="):
-                # ignore invalid lines
-                continue
-            var, val = line.split("=", 1)
-            var = var.strip().lower()
-            val = val.strip("' ").strip('" ').strip()
-            if len(val) == 0:
-                # skip invalid values
-                continue
-            # convert parameter value to correct type
-            if (sec in dfn.config_funcs and
-                    var in dfn.config_funcs[sec]):
-                # standard parameter with known type
-                val = dfn.config_funcs[sec][var](val)
-            else:
-                # unknown parameter (e.g. plotting in Shape-Out), guess type
-                var, val = keyval_str2typ(var, val)
-            if len(var) != 0 and len(str(val)) != 0:
-                cfg[sec][var] = val
+        if not line or line[0] == "#":
+            continue
+        match = _RE_CFG_LINE.match(line)
+        if match is None:
+            # ignore invalid lines
+            continue
+        sec_match, var, val = match.groups()
+        if sec_match is not None:
+            sec = sec_match.lower()
+            if sec not in cfg:
+                cfg[sec] = ConfigurationDict()
+            continue
+        var = var.lower()
+        val = val.strip("' ").strip('" ').strip()
+        if len(val) == 0:
+            # skip invalid values
+            continue
+        # convert parameter value to correct type
+        if (sec in dfn.config_funcs and
+                var in dfn.config_funcs[sec]):
+            # standard parameter with known type
+            val = dfn.config_funcs[sec][var](val)
+        else:
+            # unknown parameter (e.g. plotting in Shape-Out), guess type
+            var, val = keyval_str2typ(var, val)
+        if len(var) != 0 and len(str(val)) != 0:
+            cfg[sec][var] = val
     return cfg
 
 
@@ -376,6 +388,16 @@ def keyval_str2typ(var, val):
     if not (isinstance(val, str)):
         # already a type:
         return var.strip(), val
+    varval = _keyval_str2typ_cached(var, val)
+    if varval is not None and isinstance(varval[1], list):
+        # do not hand out the cached list
+        varval = varval[0], list(varval[1])
+    return varval
+
+
+@functools.lru_cache(maxsize=4096)
+def _keyval_str2typ_cached(var, val):
+    """Cached string conversion for :func:`keyval_str2typ`"""
     var = var.strip().lower()
     val = val.strip()
     # Find values
@@ -1,5 +1,6 @@
 """RT-DC dataset core classes and methods"""
 
+import copy
 import warnings
 
 import numpy as np
@@ -112,21 +113,19 @@ class Filter(object):
         cfg_old = self._old_config
 
         # Determine which data was updated
-        for skey in list(cfg_cur.keys()):
-            if skey not in cfg_old:
-                cfg_old[skey] = None
-            if cfg_cur[skey] != cfg_old[skey]:
+        # (keys in `cfg_cur` are lower-case, so we can use plain dicts)
+        for skey, sval in dict.items(cfg_cur):
+            oval = cfg_old.get(skey)
+            if sval != oval:
                 newkeys.append(skey)
-                oldvals.append(cfg_old[skey])
-                newvals.append(cfg_cur[skey])
+                oldvals.append(oval)
+                newvals.append(sval)
 
         # 1. Invalid filters
         self.invalid[:] = True
         if cfg_cur["remove invalid events"]:
             for feat in self.features:
-                data = rtdc_ds[feat]
-                invalid = np.isinf(data) | np.isnan(data)
-                self.invalid &= ~invalid
+                self.invalid &= np.isfinite(rtdc_ds[feat])
 
         # 2. Filter all feature min/max values.
         feat2filter = []
@@ -158,11 +157,11 @@ class Filter(object):
                 raise ValueError("Box filter: Please make sure that both "
                                  "'{}' and '{}' are set!".format(fstart, fend))
             if feat in self.features:
-                # Get the current feature filter
-                feat_filt = self[feat]
-                feat_filt[:] = True
                 # If min and max exist and if they are not identical:
                 if must_be_filtered:
+                    # Get the current feature filter
+                    feat_filt = self[feat]
+                    feat_filt[:] = True
                     ivalstart = cfg_cur[fstart]
                     ivalend = cfg_cur[fend]
                     if ivalstart > ivalend:
@@ -172,7 +171,7 @@ class Filter(object):
                     data = rtdc_ds[feat]
                     # treat nan-values in a special way
                     disnan = np.isnan(data)
-                    if np.sum(disnan):
+                    if disnan.any():
                         # this avoids RuntimeWarnings (invalid value
                         # encountered due to nan-values)
                         feat_filt[disnan] = False
@@ -185,6 +184,11 @@ class Filter(object):
                         idx = slice(0, len(self.all))  # place-holder for [:]
                     feat_filt[idx] &= ivalstart <= data[idx]
                     feat_filt[idx] &= data[idx] <= ivalend
+                elif feat in self._box_filters:
+                    # Reset existing filters in-place (references to
+                    # them remain valid), but do not create all-True
+                    # arrays for inactive box filters.
+                    self._box_filters[feat][:] = True
             elif must_be_filtered:
                 warnings.warn("Dataset '{}' does ".format(rtdc_ds.identifier)
                               + "not contain the feature '{}'! ".format(feat)
@@ -229,4 +233,4 @@ class Filter(object):
             self.all[:] = True
 
         # Actual filtering is then done during plotting
-        self._old_config = rtdc_ds.config.copy()["filtering"]
+        self._old_config = copy.deepcopy(dict(cfg_cur))
@@ -37,14 +37,6 @@ class RTDC_Dict(RTDCBase):
 
         t = time.localtime()
 
-        # Get an identifying string
-        keys = list(ddict.keys())
-        keys.sort()
-        ids = hashobj(ddict[keys[0]])
-        self._ids = ids
-        self.path = "none"
-        self.title = "{}_{:02d}_{:02d}/{}.dict".format(t[0], t[1], t[2], ids)
-
         # Populate events
         for key in ddict:
             if dfn.feature_exists(key):
@@ -56,7 +48,22 @@ class RTDC_Dict(RTDCBase):
                 raise ValueError("Invalid feature name '{}'".format(key))
             self._events[key] = data
 
-        event_count = len(ddict[list(ddict.keys())[0]])
+        event_count = len(ddict[next(iter(ddict))])
+
+        # Get an identifying string
+        keys = sorted(ddict.keys())
+        # Only hash the first events of the first feature
+        # (hashing all data would be slow for large datasets).
+        first = self._events[keys[0]]
+        if isinstance(first, dict):
+            # traces
+            first = [first[fl][:1000] for fl in sorted(first.keys())]
+        else:
+            first = first[:1000]
+        ids = hashobj([keys, event_count, first])
+        self._ids = ids
+        self.path = "none"
+        self.title = "{}_{:02d}_{:02d}/{}.dict".format(t[0], t[1], t[2], ids)
 
         self.config = Configuration()
         self.config["experiment"]["event count"] = event_count
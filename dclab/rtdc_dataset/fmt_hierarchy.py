@@ -1,12 +1,13 @@
 """RT-DC hierarchy format"""
 
+import weakref
+
 import numpy as np
 
 from .. import definitions as dfn
 
 from ..util import hashobj
 
-from .config import Configuration
 from .core import RTDCBase
 from .filter import Filter
 
@@ -233,6 +234,13 @@ class RTDC_Hierarchy(RTDCBase):
 
         #: hierarchy parent
         self.hparent = hparent
+        # parent filter and event indices of this child
+        # (see `_get_parent_indices`)
+        self._parent_filter = None
+        self._parent_indices = None
+        # dictionary of (weak reference to parent data, parent indices,
+        # filtered data) for scalar features
+        self._cache = {}
 
         self.filter = HierarchyFilter(self)
 
@@ -254,10 +262,37 @@ class RTDC_Hierarchy(RTDCBase):
             return self._events[key]
         else:
             item = self.hparent[key]
-            return item[self.hparent.filter.all]
+            pidx = self._get_parent_indices()
+            # The filtered data are reused as long as the parent filter
+            # does not change and the parent returns the same array
+            # (not the case for e.g. HDF5 data or ancillary features
+            # with a modified configuration).
+            cached = self._cache.get(key)
+            if (cached is not None
+                    and cached[0]() is item
+                    and cached[1] is pidx):
+                return cached[2]
+            data = np.take(item, pidx, axis=0)
+            # the same array is returned on every access
+            data.flags.writeable = False
+            cache = self._cache
+
+            def discard(ref):
+                # remove the entry once the parent array is gone
+                if key in cache and cache[key][0] is ref:
+                    del cache[key]
+
+            try:
+                ref = weakref.ref(item, discard)
+            except TypeError:
+                # no weak references possible, do not cache
+                pass
+            else:
+                cache[key] = (ref, pidx, data)
+            return data
 
     def __len__(self):
-        return np.sum(self.hparent.filter.all)
+        return np.count_nonzero(self.hparent.filter.all)
 
     def _check_parent_filter(self):
         """Reset filter if parent changed
@@ -272,27 +307,41 @@ class RTDC_Hierarchy(RTDCBase):
             self.filter = HierarchyFilter(self)
             self.filter.apply_manual_indices(self, manual_pidx)
 
+    def _get_parent_indices(self):
+        """Return the parent event indices that make up this child
+
+        The indices are recomputed only if the parent filter changed
+        since the last call (the parent filter may be applied without
+        calling `self.apply_filter`).
+        """
+        pfilt = self.hparent.filter.all
+        if (self._parent_indices is None
+                or not np.array_equal(pfilt, self._parent_filter)):
+            # `pfilt` is modified in-place by the parent; keep a copy
+            self._parent_filter = pfilt.copy()
+            self._parent_indices = np.flatnonzero(pfilt)
+        return self._parent_indices
+
     def _create_config(self):
         """Return a stripped configuration from the parent"""
         # create a new configuration
         cfg = self.hparent.config.copy()
         # Remove previously applied filters
-        pops = []
-        for key in cfg["filtering"]:
-            if (key.endswith(" min") or
-                key.endswith(" max") or
-                    key == "polygon filters"):
-                pops.append(key)
-        [cfg["filtering"].pop(key) for key in pops]
+        filt = cfg["filtering"]
+        pops = [key for key in filt if key.endswith((" min", " max"))]
+        for key in pops:
+            filt.pop(key)
+        filt["polygon filters"] = []
         # Add parent information in dictionary
-        cfg["filtering"]["hierarchy parent"] = self.hparent.identifier
-        return Configuration(cfg=cfg)
+        filt["hierarchy parent"] = self.hparent.identifier
+        return cfg
 
-    def _update_config(self):
+    def _update_config(self, event_count=None):
         """Update varying config values from self.hparent"""
         # event count
-        self.config["experiment"]["event count"] = np.sum(
-            self.hparent.filter.all)
+        if event_count is None:
+            event_count = len(self)
+        self.config["experiment"]["event count"] = event_count
         # calculation
         if "calculation" in self.hparent.config:
             self.config["calculation"].clear()
@@ -334,9 +383,10 @@ class RTDC_Hierarchy(RTDCBase):
         # Copy event data from hierarchy parent
         self.hparent.apply_filter(*args, **kwargs)
         # update event index
-        event_count = np.sum(self.hparent.filter.all)
+        event_count = self._get_parent_indices().size
         self._events = {}
         self._events["index"] = np.arange(1, event_count + 1)
+        self._cache = {}
         # set non-scalar column data
         if "contour" in self.hparent:
             self._events["contour"] = ChildContour(self)
@@ -353,7 +403,7 @@ class RTDC_Hierarchy(RTDCBase):
                     trdict[flname] = ChildTrace(self, flname)
             self._events["trace"] = trdict
         # Update configuration
-        self._update_config()
+        self._update_config(event_count=event_count)
 
         # create a new filter if the parent changed
         self._check_parent_filter()
@@ -375,11 +425,8 @@ def map_indices_child2parent(child, child_indices):
     parent_indices: 1d ndarray
         hierarchy parent indices
     """
-    parent = child.hparent
-    # filters
-    pf = parent.filter.all
     # indices corresponding to all child events
-    idx = np.where(pf)[0]  # True means present in the child
+    idx = child._get_parent_indices()
     # indices corresponding to selected child events
     parent_indices = idx[child_indices]
     return parent_indices
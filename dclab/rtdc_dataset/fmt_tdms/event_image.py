@@ -164,7 +164,7 @@ class ImageMap(object):
         except IndexError:
             self._get_image_workaround_seek(idx)
         else:
-            if np.all(cellimg == 0):
+            if not cellimg.any():
                 cellimg = self._get_image_workaround_seek(idx)
         # Convert to grayscale
         if len(cellimg.shape) == 3:
@@ -207,7 +207,7 @@ class ImageMap(object):
         for ii in range(idx//mult):
             cap.get_data(ii*mult)
         final = cap.get_data(idx)
-        if not np.all(final == 0):
+        if final.any():
             # This means we succeeded
             warnings.warn("Seeking video file does not work, used workaround "
                           + "which is slow!", SlowVideoWarning)
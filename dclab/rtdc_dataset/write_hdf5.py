@@ -11,9 +11,33 @@ from .._version import version
 
 #: Chunk size for storing HDF5 data
 CHUNK_SIZE = 100
+#: Maximum size of HDF5 chunks in bytes (see :func:`get_chunk_size`)
+CHUNK_SIZE_BYTES = 1024**2  # 1MiB
 
 
-def store_contour(h5group, data, compression):
+def get_chunk_size(data, chunk_bytes=CHUNK_SIZE_BYTES):
+    """Return the number of events per chunk for an HDF5 dataset
+
+    Chunks contain at least :const:`CHUNK_SIZE` events. If the
+    events are small (e.g. scalar features), then the chunks are
+    enlarged to a size of up to `chunk_bytes`. The number of events
+    per chunk is `max(CHUNK_SIZE, min(len(data), chunk_bytes //
+    event_bytes))`, i.e. it can exceed `len(data)` only if
+    `len(data)` is smaller than :const:`CHUNK_SIZE`.
+
+    Parameters
+    ----------
+    data: ndarray
+        Event data; the first axis enumerates the events
+    chunk_bytes: int
+        Maximum size of a chunk in bytes
+    """
+    event_bytes = data.dtype.itemsize * int(np.prod(data.shape[1:]))
+    num_events = min(data.shape[0], chunk_bytes // max(1, event_bytes))
+    return max(CHUNK_SIZE, num_events)
+
+
+def store_contour(h5group, data, compression, fletcher32=True):
     if not isinstance(data, (list, tuple)):
         # single event
         data = [data]
@@ -22,11 +46,12 @@ def store_contour(h5group, data, compression):
     for ii, cc in enumerate(data):
         grp.create_dataset("{}".format(curid + ii),
                            data=cc,
-                           fletcher32=True,
+                           fletcher32=fletcher32,
                            compression=compression)
 
 
-def store_image(h5group, data, compression, background=False):
+def store_image(h5group, data, compression, background=False,
+                fletcher32=True):
     """Store image data in an HDF5 group
 
     Parameters
@@ -42,6 +67,8 @@ def store_image(h5group, data, compression, background=False):
         If set to False (default), then the regular "image" is stored;
         If set to True, then the background image ("image_bg") is
         stored.
+    fletcher32: bool
+        Whether to compute fletcher32 checksums for each chunk
     """
     if background:
         image_key = "image_bg"
@@ -50,15 +77,16 @@ def store_image(h5group, data, compression, background=False):
     if len(data.shape) == 2:
         # single event
         data = data.reshape(1, data.shape[0], data.shape[1])
-    if image_key not in h5group:
+    dset = h5group.get(image_key)
+    if dset is None:
         maxshape = (None, data.shape[1], data.shape[2])
-        chunks = (CHUNK_SIZE, data.shape[1], data.shape[2])
+        chunks = (get_chunk_size(data), data.shape[1], data.shape[2])
         dset = h5group.create_dataset(image_key,
                                       data=data,
                                       dtype=np.uint8,
                                       maxshape=maxshape,
                                       chunks=chunks,
-                                      fletcher32=True,
+                                      fletcher32=fletcher32,
                                       compression=compression)
         # Create and Set image attributes:
         # HDFView recognizes this as a series of images.
@@ -68,13 +96,12 @@ def store_image(h5group, data, compression, background=False):
         dset.attrs.create('IMAGE_VERSION', np.string_('1.2'))
         dset.attrs.create('IMAGE_SUBCLASS', np.string_('IMAGE_GRAYSCALE'))
     else:
-        dset = h5group[image_key]
         oldsize = dset.shape[0]
         dset.resize(oldsize + data.shape[0], axis=0)
         dset[oldsize:] = data
 
 
-def store_mask(h5group, data, compression):
+def store_mask(h5group, data, compression, fletcher32=True):
     # store binary mask data as uint8 to allow visualization in HDFView
     data = np.asarray(data, dtype=np.uint8)
     if data.max() != 255 and data.max() != 0 and data.min() == 0:
@@ -82,15 +109,16 @@ def store_mask(h5group, data, compression):
     if len(data.shape) == 2:
         # single event
         data = data.reshape(1, data.shape[0], data.shape[1])
-    if "mask" not in h5group:
+    dset = h5group.get("mask")
+    if dset is None:
         maxshape = (None, data.shape[1], data.shape[2])
-        chunks = (CHUNK_SIZE, data.shape[1], data.shape[2])
+        chunks = (get_chunk_size(data), data.shape[1], data.shape[2])
         dset = h5group.create_dataset("mask",
                                       data=data,
                                       dtype=np.uint8,
                                       maxshape=maxshape,
                                       chunks=chunks,
-                                      fletcher32=True,
+                                      fletcher32=fletcher32,
                                       compression=compression)
         # Create and Set image attributes
         # HDFView recognizes this as a series of images
@@ -98,33 +126,31 @@ def store_mask(h5group, data, compression):
         dset.attrs.create('IMAGE_VERSION', np.string_('1.2'))
         dset.attrs.create('IMAGE_SUBCLASS', np.string_('IMAGE_GRAYSCALE'))
     else:
-        dset = h5group["mask"]
         oldsize = dset.shape[0]
         dset.resize(oldsize + data.shape[0], axis=0)
         dset[oldsize:] = data
 
 
-def store_scalar(h5group, name, data, compression):
-    if np.isscalar(data):
-        # single event
-        data = np.atleast_1d(data)
-    if name not in h5group:
+def store_scalar(h5group, name, data, compression, fletcher32=True):
+    # single events are converted to 1d arrays
+    data = np.atleast_1d(data)
+    dset = h5group.get(name)
+    if dset is None:
         h5group.create_dataset(name,
                                data=data,
                                maxshape=(None,),
-                               chunks=(CHUNK_SIZE,),
-                               fletcher32=True,
+                               chunks=(get_chunk_size(data),),
+                               fletcher32=fletcher32,
                                compression=compression
                                )
     else:
-        dset = h5group[name]
         oldsize = dset.shape[0]
         dset.resize(oldsize + data.shape[0], axis=0)
         dset[oldsize:] = data
 
 
-def store_trace(h5group, data, compression):
-    firstkey = sorted(list(data.keys()))[0]
+def store_trace(h5group, data, compression, fletcher32=True):
+    firstkey = min(data.keys())
     if len(data[firstkey].shape) == 1:
         # single event
         for dd in data:
@@ -134,24 +160,24 @@ def store_trace(h5group, data, compression):
 
     for flt in data:
         # create traces datasets
-        if flt not in grp:
+        dset = grp.get(flt)
+        if dset is None:
             maxshape = (None, data[flt].shape[1])
-            chunks = (CHUNK_SIZE, data[flt].shape[1])
+            chunks = (get_chunk_size(data[flt]), data[flt].shape[1])
             grp.create_dataset(flt,
                                data=data[flt],
                                maxshape=maxshape,
                                chunks=chunks,
-                               fletcher32=True,
+                               fletcher32=fletcher32,
                                compression=compression)
         else:
-            dset = grp[flt]
             oldsize = dset.shape[0]
             dset.resize(oldsize + data[flt].shape[0], axis=0)
             dset[oldsize:] = data[flt]
 
 
 def write(path_or_h5file, data=None, meta=None, logs=None, mode="reset",
-          compression=None):
+          compression=None, fletcher32=True):
     """Write data to an RT-DC file
 
     Parameters
@@ -211,6 +237,11 @@ def write(path_or_h5file, data=None, meta=None, logs=None, mode="reset",
     compression: str
         Compression method for "contour", "image", and "trace" data
         as well as logs; one of [None, "lzf", "gzip", "szip"].
+    fletcher32: bool
+        Whether to compute fletcher32 checksums for the chunks of the
+        feature data (default). Logs are stored without checksums,
+        because HDF5 does not support this filter for variable-length
+        strings.
 
     Notes
     -----
@@ -245,13 +276,15 @@ def write(path_or_h5file, data=None, meta=None, logs=None, mode="reset",
             # by the user (not dclab.dfn.CFG_ANALYSIS)
             msg = "Meta data section not defined in dclab: {}".format(sec)
             raise ValueError(msg)
+        sec_keys = set(dfn.config_keys[sec])
         for ck in meta[sec]:
-            if ck not in dfn.config_keys[sec]:
+            if ck not in sec_keys:
                 msg = "Meta key not defined in dclab: {}:{}".format(sec, ck)
                 raise ValueError(msg)
 
     # Check feature keys
     feat_keys = []
+    fl_traces = set(dfn.FLUOR_TRACES)
     for kk in data:
         if dfn.feature_exists(kk):
             feat_keys.append(kk)
@@ -260,7 +293,7 @@ def write(path_or_h5file, data=None, meta=None, logs=None, mode="reset",
         # verify trace names
         if kk == "trace":
             for sk in data["trace"]:
-                if sk not in dfn.FLUOR_TRACES:
+                if sk not in fl_traces:
                     msg = "Unknown trace key: {}".format(sk)
                     raise ValueError(msg)
 
@@ -289,10 +322,12 @@ def write(path_or_h5file, data=None, meta=None, logs=None, mode="reset",
         meta["setup"]["software version"] = thisver
     # Write meta
     for sec in meta:
-        for ck in meta[sec]:
+        sec_meta = meta[sec]
+        sec_funcs = dfn.config_funcs[sec]
+        for ck in sec_meta:
             idk = "{}:{}".format(sec, ck)
-            conffunc = dfn.config_funcs[sec][ck]
-            value = meta[sec][ck]
+            conffunc = sec_funcs[ck]
+            value = sec_meta[ck]
             if isinstance(value, bytes):
                 # We never store byte attribute values.
                 # In this case, `conffunc` should be `str` or `lcstr` or
@@ -315,29 +350,35 @@ def write(path_or_h5file, data=None, meta=None, logs=None, mode="reset",
             store_scalar(h5group=events,
                          name=fk,
                          data=data[fk],
-                         compression=compression)
+                         compression=compression,
+                         fletcher32=fletcher32)
         elif fk == "contour":
             store_contour(h5group=events,
                           data=data["contour"],
-                          compression=compression)
+                          compression=compression,
+                          fletcher32=fletcher32)
         elif fk == "image":
             store_image(h5group=events,
                         data=data["image"],
                         compression=compression,
-                        background=False)
+                        background=False,
+                        fletcher32=fletcher32)
         elif fk == "image_bg":
             store_image(h5group=events,
                         data=data["image_bg"],
                         compression=compression,
-                        background=True)
+                        background=True,
+                        fletcher32=fletcher32)
         elif fk == "mask":
             store_mask(h5group=events,
                        data=data["mask"],
-                       compression=compression)
+                       compression=compression,
+                       fletcher32=fletcher32)
         elif fk == "trace":
             store_trace(h5group=events,
                         data=data["trace"],
-                        compression=compression)
+                        compression=compression,
+                        fletcher32=fletcher32)
 
     # Write logs
     if logs:
@@ -354,22 +395,21 @@ def write(path_or_h5file, data=None, meta=None, logs=None, mode="reset",
                 # single event
                 ldata = [ldata]
             lnum = len(ldata)
-            if lkey not in log_group:
+            log_dset = log_group.get(lkey)
+            if log_dset is None:
                 log_dset = log_group.create_dataset(lkey,
                                                     (lnum,),
                                                     dtype=dt,
                                                     maxshape=(None,),
                                                     chunks=True,
-                                                    fletcher32=True,
                                                     compression=compression)
-                for ii, line in enumerate(ldata):
-                    log_dset[ii] = line
+                oldsize = 0
             else:
-                log_dset = log_group[lkey]
                 oldsize = log_dset.shape[0]
                 log_dset.resize(oldsize + lnum, axis=0)
-                for ii, line in enumerate(ldata):
-                    log_dset[oldsize + ii] = line
+            if lnum:
+                # write all lines at once
+                log_dset[oldsize:] = np.array(ldata, dtype=object)
 
     if mode == "append":
         return h5obj
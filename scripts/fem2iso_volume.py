@@ -33,6 +33,7 @@ An example HDF5 file can be found on figshare
 (https://doi.org/10.6084/m9.figshare.12155064.v2).
 """
 import argparse
+import functools
 import pathlib
 
 from dclab.features import emodulus
@@ -41,6 +42,19 @@ import numpy as np
 import fem2lutiso_std
 
 
+@functools.lru_cache(maxsize=1)
+def _load_analytical_2daxis():
+    """Load LUT_analytical_linear-elastic_2Daxis.txt (data and metadata)
+
+    The returned data are cached and therefore read-only.
+    """
+    here = pathlib.Path(__file__).parent
+    anap = here / "LUT_analytical_linear-elastic_2Daxis.txt"
+    data, meta = emodulus.load_mtext(anap)
+    data.flags.writeable = False
+    return data, meta
+
+
 def get_analytical_volume_LUT_2daxis():
     """Compute the volume-deformation analytical part of the LUT
 
@@ -54,28 +68,31 @@ def get_analytical_volume_LUT_2daxis():
     to better fit in with the numerical values.
     """
     # analytical area_um-deform LUT
-    ap = "LUT_analytical_linear-elastic_2Daxis.txt"
-    lut_area = np.loadtxt(pathlib.Path(__file__).parent / ap)
-    lut_volume = np.zeros_like(lut_area)
-    lut_volume[:, 1] = lut_area[:, 1]
-    lut_volume[:, 2] = lut_area[:, 2]
-
-    # FEM data
-    here = pathlib.Path(__file__).parent
-    anap = here / "LUT_analytical_linear-elastic_2Daxis.txt"
-    _, meta = emodulus.load_mtext(anap)
+    lut_area, meta = _load_analytical_2daxis()
     assert meta["channel_width"] == 20
     assert meta["method"] == "analytical"
     assert meta["dimensionality"] == "2Daxis"
 
+    # deform and emodulus are kept, the area column is replaced by volume
+    lut_volume = lut_area.copy()
+    lut_volume[:, 0] = 0
+
     # BEGIN MATLAB TRANSLATIONS
     # emodulus
-    data1 = np.linspace(7.97**(-1/2), 28.43**(-1/2), 23)**(-2)
+    data1 = np.linspace(1/np.sqrt(7.97), 1/np.sqrt(28.43), 23)
+    np.reciprocal(np.square(data1, out=data1), out=data1)
     nr_p = 100
     d = 20  # um
     # linear spaced area if assumed a sphere (spaced with square root)
-    lambda_rand = np.linspace(0.01, 0.534, nr_p, endpoint=True)**(1/2)
-    lambd = lambda_rand[np.abs(lambda_rand-0.5) < 0.5]  # 0<lambd<1
+    # (the Matlab filter 0<lambd<1 is always true for this range)
+    # The data stored in LUT_analytical_linear-elastic_2Daxis.txt does not
+    # contain the full nr_p=100 points, but it was cropped manually *sigh*.
+    # By manual inspection of of the highest emodulus isoelasticity line
+    # and comparison with area=np.pi*radius**2, I am quite certain that the
+    # first 15 data points and the last datapoint were cropped. We only
+    # compute those points of np.linspace(0.01, 0.534, nr_p) directly.
+    step = (0.534 - 0.01) / (nr_p - 1)
+    lambd = np.sqrt(0.01 + np.arange(15, nr_p - 1) * step)
     # END MATLAB TRANSLATIONS
     # In the Matlab script, area in um is computed like this:
     # Area_unitless*1.094^2*d^2*lambda(i)^2/4;
@@ -86,18 +103,19 @@ def get_analytical_volume_LUT_2daxis():
     radius = lambd * d/2 * 1.094
     volume = 4/3*np.pi * radius**3
 
-    # The data stored in LUT_analytical_linear-elastic_2Daxis.txt does not
-    # contain the full nr_p=100 points, but it was cropped manually *sigh*.
-    # By manual inspection of of the highest emodulus isoelasticity line
-    # and comparison with area=np.pi*radius**2, I am quite certain that the
-    # first 15 data points and the last datapoint were cropped.
-    volume = volume[15:-1]
-
-    for emod in data1:
-        eloc = np.abs(emod - lut_volume[:, 2]) < .01
-        assert np.sum(eloc), "failed to find emodulus {}".format(emod)
-        assert np.sum(eloc) == volume.size, "bad size emodulus {}".format(emod)
-        lut_volume[eloc, 0] = volume
+    # assign each LUT row to the closest emodulus in `data1` (ascending)
+    emods = lut_volume[:, 2]
+    idx = np.searchsorted(data1, emods).clip(1, data1.size - 1)
+    idx -= (emods - data1[idx - 1]) < (data1[idx] - emods)
+    valid = np.abs(data1[idx] - emods) < .01
+    counts = np.bincount(idx[valid], minlength=data1.size)
+    for emod, cnt in zip(data1, counts):
+        assert cnt, "failed to find emodulus {}".format(emod)
+        assert cnt == volume.size, "bad size emodulus {}".format(emod)
+    # rows sorted by emodulus, keeping their order within each isoelastic
+    rows = np.flatnonzero(valid)
+    rows = rows[np.argsort(idx[rows], kind="stable")]
+    lut_volume[rows, 0] = np.tile(volume, data1.size)
 
     return lut_volume
 
@@ -124,10 +142,10 @@ def get_lut_volume(path, processing=True):
       been numerical errors due to meshing if the area is above 290um^2.
     """
     lut_base, meta = fem2lutiso_std.get_lut_base(path)
-    lut = np.zeros((len(lut_base["emodulus"]), 3), dtype=float)
-    lut[:, 0] = lut_base["volume"]
-    lut[:, 1] = lut_base["deform"]
-    lut[:, 2] = lut_base["emodulus"]
+    # Keep float64: scipy.interpolate.griddata (qhull) in get_isoelastics
+    # works in double precision anyway.
+    lut = np.column_stack([np.asarray(lut_base[kk], dtype=float)
+                           for kk in ["volume", "deform", "emodulus"]])
 
     if processing:
         if meta["dimensionality"] == "2Daxis":
@@ -138,14 +156,32 @@ def get_lut_volume(path, processing=True):
             # Converting the 290 to an equivalent sphere volume results
             # in a value outside the lut (3700 something). So we just
             # guess a value here:
-            lut = lut[lut[:, 0] < 3200, :]
-
-        if (meta["model"] == "linear elastic"
-                and meta["dimensionality"] == "2Daxis"):
-            print("...Post-Processing: Complementing analytical volume data.")
-            # load analytical data
-            lut_ana = get_analytical_volume_LUT_2daxis()
-            lut = np.concatenate((lut, lut_ana))
+            vol = lut[:, 0]
+            if np.all(vol[:-1] <= vol[1:]):
+                # sorted by volume: the crop is a slice (no boolean mask)
+                size = np.searchsorted(vol, 3200, side="left")
+                crop = None
+            else:
+                crop = vol < 3200
+                size = np.count_nonzero(crop)
+
+            if meta["model"] == "linear elastic":
+                print("...Post-Processing: Complementing analytical "
+                      + "volume data.")
+                # load analytical data
+                lut_ana = get_analytical_volume_LUT_2daxis()
+                # crop and complement in a single allocation
+                out = np.empty((size + lut_ana.shape[0], 3), dtype=lut.dtype)
+                if crop is None:
+                    out[:size] = lut[:size]
+                else:
+                    np.compress(crop, lut, axis=0, out=out[:size])
+                out[size:] = lut_ana
+                lut = out
+            elif crop is None:
+                lut = lut[:size]
+            else:
+                lut = lut[crop]
 
     meta["column features"] = ["volume", "deform", "emodulus"]
 
@@ -230,17 +230,18 @@ def get_lut_base(path):
                 meta[key] = int(meta[key])
             else:
                 meta[key] = float(meta[key])
-        for Ek in h5.keys():
-            assert h5[Ek].attrs["emodulus_unit"].decode("utf-8") == "Pa"
-            for simk in h5[Ek].keys():
-                sim = h5[Ek][simk]
-                area_um.append(sim.attrs["area"])
-                assert sim.attrs["area_unit"].decode("utf-8") == "um^2"
-                deform.append(sim.attrs["deformation"])
-                assert sim.attrs["deformation_unit"].decode("utf-8") == ""
-                volume.append(sim.attrs["volume"])
-                assert sim.attrs["volume_unit"].decode("utf-8") == "um^3"
-                emod.append(h5[Ek].attrs["emodulus"]/1000)
+        for egroup in h5.values():
+            assert egroup.attrs["emodulus_unit"].decode("utf-8") == "Pa"
+            emod_kpa = egroup.attrs["emodulus"]/1000
+            for sim in egroup.values():
+                attrs = sim.attrs
+                area_um.append(attrs["area"])
+                assert attrs["area_unit"].decode("utf-8") == "um^2"
+                deform.append(attrs["deformation"])
+                assert attrs["deformation_unit"].decode("utf-8") == ""
+                volume.append(attrs["volume"])
+                assert attrs["volume_unit"].decode("utf-8") == "um^3"
+                emod.append(emod_kpa)
     data = {"area_um": np.array(area_um),
             "deform": np.array(deform),
             "emodulus": np.array(emod),
@@ -22,6 +22,13 @@ def test_map_str2typ():
     assert config.keyval_str2typ("a", "1,true")[1] == "1,true"
 
 
+def test_map_str2typ_cached_list():
+    lst = config.keyval_str2typ("a", "[1, 2]")[1]
+    lst.append(3)
+    # the cached value must not be modified
+    assert config.keyval_str2typ("a", "[1, 2]")[1] == [1, 2]
+
+
 if __name__ == "__main__":
     # Run all tests
     loc = locals()
@@ -7,6 +7,7 @@ import warnings
 
 import numpy as np
 
+from dclab import definitions as dfn
 from dclab.rtdc_dataset import new_dataset
 import dclab.rtdc_dataset.config as dccfg
 
@@ -34,6 +35,35 @@ def test_config_basic():
     assert ds.config["imaging"]["roi size y"] == 96.
 
 
+def test_config_dict_case_insensitive():
+    cd = dccfg.ConfigurationDict(section="setup", **{"Channel Width": 20})
+    assert cd["channel width"] == 20
+    assert "CHANNEL WIDTH" in cd
+    assert cd.get("Channel width") == 20
+    cd.update({"Flow Rate": 0.04})
+    assert list(cd.keys()) == ["channel width", "flow rate"]
+    assert cd.setdefault("MEDIUM", "CellCarrier") == "CellCarrier"
+    assert cd.setdefault("medium", "water") == "CellCarrier"
+    assert cd.pop("Flow rate") == 0.04
+    del cd["Medium"]
+    assert list(cd.keys()) == ["channel width"]
+    # copying between dicts of the same section
+    cd2 = dccfg.ConfigurationDict(section="setup")
+    cd2.update(cd)
+    assert cd2["Channel Width"] == 20
+
+
+def test_config_default_filtering():
+    # Make sure that all filtering values have a default value
+    # (otherwise we will get problems with resetting filters)
+    for item in dfn.CFG_ANALYSIS["filtering"]:
+        assert item[0] in dccfg.DEFAULT_FILTERING
+    cfg1 = dccfg.Configuration()
+    cfg2 = dccfg.Configuration()
+    cfg1["filtering"]["polygon filters"].append(1)
+    assert cfg2["filtering"]["polygon filters"] == []
+
+
 def test_config_invalid_key():
     ds = new_dataset(retrieve_data(example_data_sets[1]))
     with warnings.catch_warnings(record=True) as w:
@@ -61,6 +91,34 @@ def test_config_save_load():
         pass
 
 
+def test_config_save_load_utf8():
+    cfg = dccfg.Configuration()
+    cfg["setup"]["medium"] = "CellCarrier µ"
+    cfg_file = tempfile.mktemp(prefix="test_dclab_rtdc_config_")
+    cfg.save(cfg_file)
+    loaded = dccfg.Configuration(files=[cfg_file])
+    assert loaded["setup"]["medium"] == "CellCarrier µ"
+    try:
+        os.remove(cfg_file)
+    except OSError:
+        pass
+
+
+def test_config_load_locale_fallback(monkeypatch):
+    # e.g. a file written with cp1252 on Windows
+    monkeypatch.setattr("locale.getpreferredencoding",
+                        lambda do_setlocale=True: "cp1252")
+    cfg_file = tempfile.mktemp(prefix="test_dclab_rtdc_config_")
+    with open(cfg_file, "wb") as fd:
+        fd.write("[setup]\nmedium = CellCarrier µ\n".encode("cp1252"))
+    loaded = dccfg.Configuration(files=[cfg_file])
+    assert loaded["setup"]["medium"] == "CellCarrier µ"
+    try:
+        os.remove(cfg_file)
+    except OSError:
+        pass
+
+
 def test_config_update():
     ds = new_dataset(retrieve_data(example_data_sets[1]))
     assert ds.config["imaging"]["roi size y"] == 96.
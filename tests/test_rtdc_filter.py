@@ -53,6 +53,26 @@ def test_filter_manual():
     assert ds["deform"][1] == ds["deform"][ds.filter.all][0]
 
 
+def test_filter_min_max_reset():
+    ddict = example_data_dict(size=8472, keys=["area_um", "deform"])
+    ds = new_dataset(ddict)
+    amin, amax = ds["area_um"].min(), ds["area_um"].max()
+    ds.config["filtering"]["area_um min"] = (amax + amin) / 2
+    ds.config["filtering"]["area_um max"] = amax
+    ds.apply_filter()
+    assert np.sum(ds.filter.all) == 4256
+    area_filt = ds.filter["area_um"]
+    # disable the box filter again
+    ds.config["filtering"]["area_um min"] = 0
+    ds.config["filtering"]["area_um max"] = 0
+    ds.apply_filter()
+    assert np.sum(ds.filter.all) == 8472
+    assert np.all(ds.filter["area_um"])
+    # the filter array is reset in-place
+    assert ds.filter["area_um"] is area_filt
+    assert np.all(area_filt)
+
+
 def test_filter_min_max():
     # make sure min/max values are filtered
     ddict = example_data_dict(size=8472, keys=["area_um", "deform"])
@@ -34,6 +34,58 @@ def test_config_calculation():
     assert ch.config["calculation"]["emodulus temperature"] == 24.0
 
 
+def test_feature_cache():
+    ddict = example_data_dict(size=42, keys=["area_um", "deform"])
+    ds = new_dataset(ddict)
+    ds.filter.manual[0] = False
+    ch = new_dataset(ds)
+    deform = ch["deform"]
+    assert ch["deform"] is deform
+    assert np.all(deform == ds["deform"][1:])
+    # the cache is invalidated with `apply_filter`
+    ds.filter.manual[1] = False
+    ds.apply_filter()
+    ch.apply_filter()
+    assert ch["deform"] is not deform
+    assert np.all(ch["deform"] == ds["deform"][2:])
+
+
+def test_feature_cache_read_only():
+    ddict = example_data_dict(size=42, keys=["area_um", "deform"])
+    ds = new_dataset(ddict)
+    ch = new_dataset(ds)
+    deform = ch["deform"]
+    with pytest.raises(ValueError, match="read-only"):
+        deform[0] = -1
+    assert ch["deform"][0] == ds["deform"][0]
+
+
+@pytest.mark.filterwarnings(
+    'ignore::dclab.rtdc_dataset.config.UnknownConfigurationKeyWarning')
+def test_feature_cache_hdf5():
+    path = retrieve_data("rtdc_data_hdf5_mask_contour.zip")
+    ds = new_dataset(path)
+    ds.filter.manual[0] = False
+    ch = new_dataset(ds)
+    assert np.all(ch["deform"] == ds["deform"][1:])
+    # the HDF5 parent returns a new array each time, there is
+    # nothing to reuse and no copy of the parent data is kept
+    assert "deform" not in ch._cache
+
+
+def test_feature_cache_parent_changed():
+    ddict = example_data_dict(size=42, keys=["area_um", "deform"])
+    ds = new_dataset(ddict)
+    ch = new_dataset(ds)
+    assert len(ch["deform"]) == 42
+    # filter only the parent
+    ds.filter.manual[:10] = False
+    ds.apply_filter()
+    assert len(ch) == 32
+    assert len(ch["deform"]) == 32
+    assert np.all(ch["deform"] == ds["deform"][10:])
+
+
 def test_event_count():
     tdms_path = retrieve_data(example_data_sets[1])
     ds = new_dataset(tdms_path)
@@ -158,6 +210,19 @@ def test_index_deep_contour():
     assert np.all(c2["contour"][3] == ds["contour"][5])
 
 
+def test_index_parent_changed():
+    data = example_data_dict(42, keys=["area_um", "contour", "deform"])
+    ds = new_dataset(data)
+    ch = new_dataset(ds)
+    assert np.all(ch["contour"][0] == ds["contour"][0])
+    # filter only the parent
+    ds.filter.manual[:10] = False
+    ds.apply_filter()
+    assert np.all(fmt_hierarchy.map_indices_child2parent(ch, [0, 1, 2])
+                  == [10, 11, 12])
+    assert np.all(ch["contour"][0] == ds["contour"][10])
+
+
 def test_manual_exclude():
     data = example_data_dict(42, keys=["area_um", "deform"])
     p = new_dataset(data)
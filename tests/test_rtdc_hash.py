@@ -7,7 +7,7 @@ from helper_methods import example_data_dict, retrieve_data, example_data_sets
 def test_hash_dict():
     ddict = example_data_dict()
     ds = new_dataset(ddict)
-    assert ds.hash == "5bd08693349fd40369860474e3dab144"
+    assert ds.hash == "6b1a9782da3aa08cc518f2824d945c79"
 
 
 def test_hash_hierarchy():
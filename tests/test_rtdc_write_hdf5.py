@@ -19,6 +19,35 @@ def test_bulk_scalar():
         assert np.all(events["area_um"][:] == data["area_um"])
 
 
+def test_bulk_scalar_chunks():
+    data = {"area_um": np.linspace(100.7, 110.9, 200000),
+            "deform": np.linspace(.01, .02, 50)}
+    rtdc_file = tempfile.mktemp(suffix=".rtdc",
+                                prefix="dclab_test_bulk_scalar_chunks_")
+    write(rtdc_file, {"area_um": data["area_um"]})
+    write(rtdc_file, {"deform": data["deform"]}, mode="replace")
+    with h5py.File(rtdc_file, mode="r") as rtdc_data:
+        events = rtdc_data["events"]
+        # chunks are limited to 1MiB
+        assert events["area_um"].chunks == (2**20 // 8,)
+        # chunks contain at least 100 events
+        assert events["deform"].chunks == (100,)
+        assert np.all(events["area_um"][:] == data["area_um"])
+
+
+def test_bulk_scalar_fletcher32():
+    data = {"area_um": np.linspace(100.7, 110.9, 100)}
+    rtdc_file = tempfile.mktemp(suffix=".rtdc",
+                                prefix="dclab_test_bulk_scalar_fletcher32_")
+    write(rtdc_file, data, logs={"log1": ["line 1"]}, fletcher32=False)
+    with h5py.File(rtdc_file, mode="r") as rtdc_data:
+        assert not rtdc_data["events"]["area_um"].fletcher32
+        assert not rtdc_data["logs"]["log1"].fletcher32
+    write(rtdc_file, data)
+    with h5py.File(rtdc_file, mode="r") as rtdc_data:
+        assert rtdc_data["events"]["area_um"].fletcher32
+
+
 def test_bulk_contour():
     num = 7
     contour = []